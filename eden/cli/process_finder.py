@@ -90,7 +90,11 @@ class ProcessFinder(abc.ABC):
 
     @abc.abstractmethod
     def get_process_start_time(self, pid: int) -> float:
-        """Get the start time of the process, in seconds since the Unix epoch."""
+        """Get the start time of the process, in seconds since the Unix epoch.
+
+        Note that the FakeProcessFinder used in tests reports start times relative
+        to time.monotonic() instead.
+        """
         raise NotImplementedError()
 
     def read_lock_file(self, path: Path) -> bytes:
@@ -223,10 +227,17 @@ class LinuxProcessFinder(ProcessFinder):
         boot_time = self._system_boot_time
         if boot_time is None:
             uptime_seconds = self._read_system_uptime()
-            boot_time = time.time() - uptime_seconds
+            boot_time = self._now() - uptime_seconds
             self._system_boot_time = boot_time
         return boot_time
 
+    def _now(self) -> float:
+        """Return the current time on the clock used for process start times.
+        This exists as a separate method solely to allow it to be overridden in unit
+        tests.
+        """
+        return time.time()
+
     def _read_system_uptime(self) -> float:
         uptime_line = (self.proc_path / "uptime").read_text()
         return float(uptime_line.split(" ", 1)[0])
@@ -28,6 +28,15 @@ _default_start_age = datetime.timedelta(hours=1)
 
 
 class FakeProcessFinder(process_finder.LinuxProcessFinder):
+    """A LinuxProcessFinder that reads fake /proc data from a temporary directory.
+
+    Note that all fake process times are measured against time.monotonic() rather
+    than the wall clock, so that tests comparing process ages are not affected by
+    wall clock adjustments.  get_process_start_time() and the st_atime, st_mtime,
+    and st_ctime fields of the fake /proc/PID stat results are therefore on the
+    time.monotonic() scale, not seconds since the Unix epoch.
+    """
+
     _file_contents: Dict[Path, Union[bytes, Exception]] = {}
     _process_stat: Dict[int, os.stat_result] = {}
     _default_uid: int
@@ -36,6 +45,9 @@ class FakeProcessFinder(process_finder.LinuxProcessFinder):
     def __init__(self, tmp_dir: str, default_uid: Optional[int] = None) -> None:
         self.proc_path = Path(tmp_dir)
         self._default_uid = os.getuid() if default_uid is None else default_uid
+        # The files and directories created under proc_path, in creation order
+        self._created_files: List[Path] = []
+        self._created_dirs: List[Path] = []
 
     def add_process(
         self,
@@ -49,25 +61,27 @@ class FakeProcessFinder(process_finder.LinuxProcessFinder):
         start_age: datetime.timedelta = _default_start_age,
     ) -> None:
         pid_dir = self.proc_path / str(pid)
-        pid_dir.mkdir()
+        fd_dir = pid_dir / "fd"
+        os.makedirs(fd_dir)
+        self._created_dirs += [pid_dir, fd_dir]
 
         if comm is None:
             comm = os.path.basename(cmdline[0])[:15]
-        (pid_dir / "comm").write_bytes(comm.encode("utf-8") + b"\n")
+        self._write_file(pid_dir / "comm", comm.encode("utf-8") + b"\n")
 
         cmdline_bytes = b"".join((arg.encode("utf-8") + b"\0") for arg in cmdline)
-        (pid_dir / "cmdline").write_bytes(cmdline_bytes)
+        self._write_file(pid_dir / "cmdline", cmdline_bytes)
 
-        start_time = time.time() - start_age.total_seconds()
+        start_time = self._now() - start_age.total_seconds()
         self._process_stat[pid] = self._make_fake_process_metadata(
             pid, uid=uid, start_time=start_time
         )
 
-        fd_dir = pid_dir / "fd"
-        fd_dir.mkdir()
         if fds:
             for fd, contents in fds.items():
-                (fd_dir / str(fd)).symlink_to(contents)
+                fd_path = fd_dir / str(fd)
+                fd_path.symlink_to(contents)
+                self._created_files.append(fd_path)
 
         if build_info:
             self._build_info[pid] = build_info
@@ -75,7 +89,7 @@ class FakeProcessFinder(process_finder.LinuxProcessFinder):
         stat_contents = self.make_fake_proc_stat_contents(
             pid, command=comm, ppid=ppid, start_time=start_time
         )
-        (pid_dir / "stat").write_text(stat_contents)
+        self._write_file(pid_dir / "stat", stat_contents.encode("utf-8"))
 
     def add_edenfs(
         self,
@@ -150,6 +164,34 @@ class FakeProcessFinder(process_finder.LinuxProcessFinder):
         )
         return build_info
 
+    def teardown(self) -> None:
+        """Remove the fake /proc entries created by this finder.
+        This is best-effort: paths that were already removed are ignored, and
+        directories that still contain files the finder did not create are left in
+        place for the caller's temporary directory cleanup to remove.
+        """
+        for path in self._created_files:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                # Some tests remove fake /proc files themselves
+                pass
+        for path in reversed(self._created_dirs):
+            try:
+                os.rmdir(path)
+            except OSError:
+                pass
+        self._created_files.clear()
+        self._created_dirs.clear()
+
+    def _write_file(self, path: Path, contents: bytes) -> None:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, contents)
+        finally:
+            os.close(fd)
+        self._created_files.append(path)
+
     def set_file_contents(self, path: Union[Path, str], contents: bytes) -> None:
         self._file_contents[Path(path)] = contents
 
@@ -202,6 +244,9 @@ class FakeProcessFinder(process_finder.LinuxProcessFinder):
         p.build_info = build_info
         return p
 
+    def _now(self) -> float:
+        return time.monotonic()
+
     def _read_system_uptime(self) -> float:
         # Report an uptime of 1 year when running tests.
         # This helps ensure that we don't test with any process start times that
@@ -7,13 +7,12 @@
 # pyre-strict
 
 import datetime
-import shutil
 import tempfile
 import time
 import unittest
 from datetime import timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from eden.cli.process_finder import BuildInfo, EdenFSProcess
 from eden.cli.test.lib.fake_process_finder import FakeProcessFinder
@@ -22,9 +21,11 @@ from eden.cli.test.lib.fake_process_finder import FakeProcessFinder
 class ProcessFinderTests(unittest.TestCase):
     def setUp(self) -> None:
         self.maxDiff: Optional[int] = None
-        self.tmpdir = Path(tempfile.mkdtemp(prefix="eden_test."))
-        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self._tmpctx = tempfile.TemporaryDirectory(prefix="eden_test.")
+        self.tmpdir = Path(self._tmpctx.name)
+        self.addCleanup(self._tmpctx.cleanup)
         self.process_finder = FakeProcessFinder(str(self.tmpdir))
+        self.addCleanup(self.process_finder.teardown)
 
     def test_find_edenfs(self) -> None:
         # Add some non-EdenFS processes
@@ -65,10 +66,11 @@ class ProcessFinderTests(unittest.TestCase):
         )
 
         # Call get_edenfs_processes() and check the results
-        found_processes = {p.pid: p for p in self.process_finder.get_edenfs_processes()}
-        found_minus_cmdline = {
-            p.pid: p._replace(cmdline=[]) for p in found_processes.values()
-        }
+        found_processes: Dict[int, EdenFSProcess] = {}
+        found_minus_cmdline: Dict[int, EdenFSProcess] = {}
+        for p in self.process_finder.get_edenfs_processes():
+            found_processes[p.pid] = p
+            found_minus_cmdline[p.pid] = p._replace(cmdline=[])
         expected_minus_cmdline = {
             1234: EdenFSProcess(
                 pid=1234, uid=99, eden_dir=Path("/home/nobody/eden_dir_1"), cmdline=[]
@@ -86,33 +88,27 @@ class ProcessFinderTests(unittest.TestCase):
         self.assertEqual(found_minus_cmdline, expected_minus_cmdline)
 
         # Check the build info
+        self.assertEqual(found_processes[1234].get_build_info(), BuildInfo())
         self.assertEqual(
-            repr(found_processes[1234].get_build_info()), repr(BuildInfo())
-        )
-        self.assertEqual(
-            repr(found_processes[4567].get_build_info()),
-            repr(
-                BuildInfo(
-                    package_name="fb-eden",
-                    package_version="20200101",
-                    package_release="000000",
-                    revision="1" * 40,
-                    upstream_revision="1" * 40,
-                    build_time=build_time_4567,
-                )
+            found_processes[4567].get_build_info(),
+            BuildInfo(
+                package_name="fb-eden",
+                package_version="20200101",
+                package_release="000000",
+                revision="1" * 40,
+                upstream_revision="1" * 40,
+                build_time=build_time_4567,
             ),
         )
         self.assertEqual(
-            repr(found_processes[9999].get_build_info()),
-            repr(
-                BuildInfo(
-                    package_name="fb-eden",
-                    package_version="20191213",
-                    package_release="123456",
-                    revision="1" * 40,
-                    upstream_revision="1" * 40,
-                    build_time=build_time_9999,
-                )
+            found_processes[9999].get_build_info(),
+            BuildInfo(
+                package_name="fb-eden",
+                package_version="20191213",
+                package_release="123456",
+                revision="1" * 40,
+                upstream_revision="1" * 40,
+                build_time=build_time_9999,
             ),
         )
 
@@ -128,13 +124,19 @@ class ProcessFinderTests(unittest.TestCase):
         )
 
     def assert_age_near(self, age: timedelta, timestamp: float) -> None:
-        now = time.time()
-        absolute_age = time.time() - age.total_seconds()
+        # FakeProcessFinder reports start times relative to the monotonic clock
+        now = time.monotonic()
+        absolute_age = now - age.total_seconds()
         if absolute_age > (timestamp - 1.0) and absolute_age < (timestamp + 1.0):
             return
 
+        # Convert the monotonic timestamps to wall clock times for display
+        wall_clock_offset = time.time() - now
+
         def time_str(ts: float) -> str:
-            dt = datetime.datetime.fromtimestamp(ts, tz=datetime.timezone.utc)
+            dt = datetime.datetime.fromtimestamp(
+                ts + wall_clock_offset, tz=datetime.timezone.utc
+            )
             return dt.strftime("%Y-%m-%d %H:%M:%S")
 
         msg = (
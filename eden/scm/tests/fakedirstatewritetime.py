@@ -7,6 +7,9 @@
 
 from __future__ import absolute_import
 
+import contextlib
+import functools
+
 from edenscm.mercurial import (
     context,
     dirstate,
@@ -25,43 +28,88 @@ configitem = registrar.configitem(configtable)
 
 configitem("fakedirstatewritetime", "fakenow", default=None)
 
+# raw config value -> parsed unixtime
+_fakenowcache = {}
+
+
+def _getfakenow(ui):
+    """Return the configured fake "now" as a unixtime, or None if unset
+
+    Each distinct raw config value is parsed only once.
+    """
+    raw = ui.config("fakedirstatewritetime", "fakenow")
+    if not raw:
+        return None
+    parsed = _fakenowcache.get(raw)
+    if parsed is None:
+        parsed = util.parsedate(raw)[0]
+        _fakenowcache[raw] = parsed
+    return parsed
+
+
+# fakenow -> replacement for 'dirstate._getfsnow' returning fakenow
+_getfsnowcache = {}
+
+
+def _getfsnowfunc(fakenow):
+    """Return a function ignoring its arguments and returning 'fakenow'
+
+    One function is built per distinct 'fakenow' and shared across writes.
+    """
+    func = _getfsnowcache.get(fakenow)
+    if func is None:
+
+        def func(*args):
+            return fakenow
+
+        _getfsnowcache[fakenow] = func
+    return func
+
 
 def pack_dirstate(fakenow, orig, dmap, copymap, pl, now):
     # execute what original parsers.pack_dirstate should do actually
     # for consistency
     actualnow = int(now)
+    dirstatetuple = parsers.dirstatetuple
     for f, e in pycompat.iteritems(dmap):
-        if e[0] == "n" and e[3] == actualnow:
-            e = parsers.dirstatetuple(e[0], e[1], e[2], -1)
-            dmap[f] = e
+        # check mtime first: it rules out most entries more cheaply than state
+        if e[3] == actualnow and e[0] == "n":
+            dmap[f] = dirstatetuple(e[0], e[1], e[2], -1)
 
     return orig(dmap, copymap, pl, fakenow)
 
 
+@contextlib.contextmanager
+def _patchednow(fakenow):
+    """Replace 'parsers.pack_dirstate' and 'dirstate._getfsnow' so that
+    dirstate writes within the block use 'fakenow'"""
+    orig_pack_dirstate = parsers.pack_dirstate
+    orig_dirstate_getfsnow = dirstate._getfsnow
+
+    parsers.pack_dirstate = functools.partial(
+        pack_dirstate, fakenow, orig_pack_dirstate
+    )
+    dirstate._getfsnow = _getfsnowfunc(fakenow)
+    try:
+        yield
+    finally:
+        parsers.pack_dirstate = orig_pack_dirstate
+        dirstate._getfsnow = orig_dirstate_getfsnow
+
+
 def fakewrite(ui, func):
     # fake "now" of 'pack_dirstate' only if it is invoked while 'func'
 
-    fakenow = ui.config("fakedirstatewritetime", "fakenow")
-    if not fakenow:
+    fakenow = _getfakenow(ui)
+    if fakenow is None:
         # Execute original one, if fakenow isn't configured. This is
         # useful to prevent subrepos from executing replaced one,
         # because replacing 'parsers.pack_dirstate' is also effective
         # in subrepos.
         return func()
 
-    fakenow = util.parsedate(fakenow)[0]
-
-    orig_pack_dirstate = parsers.pack_dirstate
-    orig_dirstate_getfsnow = dirstate._getfsnow
-    wrapper = lambda *args: pack_dirstate(fakenow, orig_pack_dirstate, *args)
-
-    parsers.pack_dirstate = wrapper
-    dirstate._getfsnow = lambda *args: fakenow
-    try:
+    with _patchednow(fakenow):
         return func()
-    finally:
-        parsers.pack_dirstate = orig_pack_dirstate
-        dirstate._getfsnow = orig_dirstate_getfsnow
 
 
 def _poststatusfixup(orig, self, status, workingctx, oldid):
@@ -76,17 +124,17 @@ def markcommitted(orig, committablectx, node):
 
 def treedirstatewrite(orig, self, st, now):
     ui = self._ui
-    fakenow = ui.config("fakedirstatewritetime", "fakenow")
-    if fakenow:
-        now = util.parsedate(fakenow)[0]
+    fakenow = _getfakenow(ui)
+    if fakenow is not None:
+        now = fakenow
     return orig(self, st, now)
 
 
 def treestatewrite(orig, self, st, now):
     ui = self._ui
-    fakenow = ui.config("fakedirstatewritetime", "fakenow")
-    if fakenow:
-        now = util.parsedate(fakenow)[0]
+    fakenow = _getfakenow(ui)
+    if fakenow is not None:
+        now = fakenow
     return orig(self, st, now)
 
 
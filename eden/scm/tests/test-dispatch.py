@@ -20,20 +20,24 @@ def testdispatch(cmd):
     print("result: %r" % (result,))
 
 
+def writefile(path, data, flags):
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | flags, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 testdispatch("init test1")
 os.chdir("test1")
 
 # create file 'foo', add and commit
-f = open("foo", "wb")
-f.write(b"foo\n")
-f.close()
+writefile("foo", b"foo\n", os.O_TRUNC)
 testdispatch("add foo")
 testdispatch("commit -m commit1 -d 2000-01-01 foo")
 
 # append to file 'foo' and commit
-f = open("foo", "ab")
-f.write(b"bar\n")
-f.close()
+writefile("foo", b"bar\n", os.O_APPEND)
 testdispatch("commit -m commit2 -d 2000-01-02 foo")
 
 # check 88803a69b24 (fancyopts modified command table)